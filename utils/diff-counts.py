@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 from __future__ import annotations
+from collections import Counter
 from termcolor import colored
-from typing import Dict, TextIO
+from typing import TextIO
 import argparse
 import re
 import sys
@@ -12,7 +13,7 @@ LINE_RE = re.compile(r'\s*(\d+)\s+(.+)')
 # Tally up the counts in an input file, weighing each count by `factor`. This
 # allows two calls to this function to add the counts in one line, and subtract
 # the counts in another. Returns the total count.
-def tally_file(tally: Dict[str, int], factor: int, file: TextIO) -> int:
+def tally_file(tally: Counter[str], factor: int, file: TextIO) -> int:
     total = 0
     for line_number, line in enumerate(file):
         # Skip empty lines.
@@ -28,7 +29,7 @@ def tally_file(tally: Dict[str, int], factor: int, file: TextIO) -> int:
         # Add to the dictionary.
         count = int(m[1]) * factor
         key = m[2]
-        tally[key] = tally.get(key, 0) + count
+        tally[key] += count
         total += count
 
     return total
@@ -47,7 +48,7 @@ def main() -> None:
     args = parser.parse_args()
 
     # Process the input files.
-    tally: Dict[str, int] = dict()
+    tally: Counter[str] = Counter()
     total = 0
     total += tally_file(tally, -1, args.old)
     total += tally_file(tally, 1, args.new)
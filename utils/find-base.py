@@ -25,31 +25,43 @@ import argparse
 import os
 import re
 import subprocess
+from typing import Iterator
 
 LEAF_RE = re.compile(r'\d{4}-\d{2}-\d{2}-\d{6}-main-([0-9a-f]+)$')
+RESULT_RE = re.compile(r'\d{4}-\d{2}-\d{2}-\d{6}-')
 
 
-def find_result_dirs(results_dir: str) -> list[tuple[str, str]]:
-    """Walk the results directory tree for `main`-kind result directories.
+def find_result_dirs(results_dir: str) -> Iterator[tuple[str, str]]:
+    """Lazily walk the results directory tree for `main`-kind result directories.
 
-    Directories whose leaf name matches the result naming pattern are collected
-    and not descended into further. Returns (relative_path, sha) tuples sorted
-    newest-to-oldest (reverse lexicographic on the relative path).
+    The entries of each directory are visited in reverse lexicographic order,
+    which yields the `YYYY/MM/YYYY-MM-DD-HHMMSS-...` layout newest-to-oldest
+    without collecting and sorting the entire tree first. Callers that stop at
+    the first suitable result therefore only scan the most recent directories.
+
+    Directories whose leaf name matches the result naming pattern are yielded
+    as (relative_path, sha) tuples and not descended into further. Result
+    directories of other kinds (e.g. PR runs) and hidden directories such as
+    `.git` are skipped entirely, since they can never contain a match.
     """
-    entries: list[tuple[str, str]] = []
-    for dirpath, dirnames, _ in os.walk(results_dir):
-        # Check each subdirectory; collect matches and prune them from the walk.
-        prune = set()
-        for name in dirnames:
+
+    def walk(rel_dir: str) -> Iterator[tuple[str, str]]:
+        # Like `os.walk`, silently skip directories that cannot be listed.
+        try:
+            with os.scandir(os.path.join(results_dir, rel_dir)) as it:
+                names = sorted((entry.name for entry in it
+                                if entry.is_dir(follow_symlinks=False)),
+                               reverse=True)
+        except OSError:
+            return
+        for name in names:
             m = LEAF_RE.fullmatch(name)
             if m:
-                rel = os.path.relpath(os.path.join(dirpath, name), results_dir)
-                entries.append((rel, m.group(1)))
-                prune.add(name)
-        dirnames[:] = [d for d in dirnames if d not in prune]
+                yield os.path.join(rel_dir, name), m.group(1)
+            elif not name.startswith(".") and not RESULT_RE.match(name):
+                yield from walk(os.path.join(rel_dir, name))
 
-    entries.sort(reverse=True)
-    return entries
+    yield from walk("")
 
 
 def resolve_upper_bound(circt_repo: str, main_ref: str) -> str:
@@ -72,13 +84,41 @@ def resolve_upper_bound(circt_repo: str, main_ref: str) -> str:
     return "HEAD~1"
 
 
-def is_ancestor(circt_repo: str, sha: str, upper: str) -> bool:
-    """Check if `sha` is an ancestor of `upper` in the CIRCT repo."""
+def list_commits(circt_repo: str, *revs: str) -> list[str]:
+    """List the full SHAs of all commits reachable from `revs`.
+
+    Commits beyond a shallow clone's boundary are not listed, just like
+    `git merge-base --is-ancestor` fails for commits that are not available
+    locally. Returns an empty list if any of the `revs` cannot be resolved.
+    """
     result = subprocess.run(
-        ["git", "-C", circt_repo, "merge-base", "--is-ancestor", sha, upper],
+        ["git", "-C", circt_repo, "rev-list", *revs],
         capture_output=True,
+        text=True,
     )
-    return result.returncode == 0
+    if result.returncode != 0:
+        return []
+    return result.stdout.split()
+
+
+def resolve_short_sha(sha: str, commits: list[str],
+                      indices: dict[int, dict[str, str | None]]) -> str | None:
+    """Resolve the short `sha` to the one of `commits` it abbreviates.
+
+    `indices` caches a map from abbreviation to commit for each abbreviation
+    length seen so far, such that every lookup is a dictionary access. Returns
+    None if no commit or more than one commit matches. Note that git considers
+    an abbreviation ambiguous if it matches any object in the repository,
+    whereas this only considers the given `commits`.
+    """
+    index = indices.get(len(sha))
+    if index is None:
+        index = {}
+        for commit in commits:
+            abbrev = commit[:len(sha)]
+            index[abbrev] = None if abbrev in index else commit
+        indices[len(sha)] = index
+    return index.get(sha)
 
 
 def main() -> None:
@@ -98,10 +138,15 @@ def main() -> None:
         "point at the upstream target branch, not a fork's `main`.")
     args = parser.parse_args()
 
+    # List all local commits and the ancestors of the upper bound once, instead
+    # of running `git merge-base --is-ancestor` for every candidate result.
     upper = resolve_upper_bound(args.circt_repo, args.main_ref)
+    ancestors = set(list_commits(args.circt_repo, upper))
+    commits = list_commits(args.circt_repo, "--all")
+    indices: dict[int, dict[str, str | None]] = {}
 
     for rel_path, sha in find_result_dirs(args.results_dir):
-        if is_ancestor(args.circt_repo, sha, upper):
+        if resolve_short_sha(sha, commits, indices) in ancestors:
             print(rel_path)
             return
 
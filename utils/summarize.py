@@ -4,6 +4,7 @@
 # as a bullet-point list with links to the results, CIRCT commits, and CI run.
 from __future__ import annotations
 import argparse
+import filecmp
 import os
 import re
 import subprocess
@@ -68,7 +69,8 @@ def generate_delta_list(current_path: str, base_path: str) -> str | None:
     """Run diff-counts.py and format the output as a bullet-point list.
 
     The last line from diff-counts.py (total change) is promoted to the
-    first bullet. Returns None if there are no changes.
+    first bullet. Returns None if there are no changes, without running
+    diff-counts.py at all if both error lists are identical.
     """
     script = os.path.join(os.path.dirname(__file__), "diff-counts.py")
     old_errors = os.path.join(base_path, "sv-tests/errors.txt")
@@ -76,6 +78,8 @@ def generate_delta_list(current_path: str, base_path: str) -> str | None:
 
     if not os.path.isfile(old_errors) or not os.path.isfile(new_errors):
         return None
+    if filecmp.cmp(old_errors, new_errors, shallow=False):
+        return None
 
     output = subprocess.check_output(
         [sys.executable, script, old_errors, new_errors],
@@ -151,6 +155,17 @@ def generate_segfault_changes(current_path: str,
     return fixed, introduced
 
 
+def write_segfault_list(verb: str, test_names: list[str]) -> None:
+    """Write a `<verb> N segfaults:` heading followed by a list of tests."""
+    if not test_names:
+        return
+    count = len(test_names)
+    sys.stdout.write(
+        f"\n{verb} {count} segfault{'s' if count != 1 else ''}:\n")
+    for test_name in test_names:
+        sys.stdout.write(f"- {code_span(test_name)}\n")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Generate a markdown summary of test results.")
@@ -206,19 +221,8 @@ def main() -> None:
         sys.stdout.write(
             f"\nChanges in emitted diagnostics:\n{delta_list}\n")
 
-    if fixed:
-        count = len(fixed)
-        sys.stdout.write(
-            f"\nFixed {count} segfault{'s' if count != 1 else ''}:\n")
-        for test_name in fixed:
-            sys.stdout.write(f"- {code_span(test_name)}\n")
-
-    if introduced:
-        count = len(introduced)
-        sys.stdout.write(
-            f"\nIntroduced {count} segfault{'s' if count != 1 else ''}:\n")
-        for test_name in introduced:
-            sys.stdout.write(f"- {code_span(test_name)}\n")
+    write_segfault_list("Fixed", fixed)
+    write_segfault_list("Introduced", introduced)
 
 
 if __name__ == '__main__':
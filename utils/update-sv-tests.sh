@@ -3,7 +3,13 @@ set -e
 cd "$(dirname "${BASH_SOURCE[0]}")/.."
 git submodule update --depth=1 --init ext/sv-tests
 cd ext/sv-tests
-git submodule update --depth=1 --init --recursive third_party/cores
-git submodule update --depth=1 --init --recursive third_party/tests
-git submodule update --depth=1 --init third_party/tools/icarus
-git submodule update --depth=1 --init third_party/tools/yosys
+
+# Fetch the nested submodules in parallel. The cores and tests each pull in a
+# large number of independent repositories, so group them into as few
+# invocations as possible to let git overlap the clones.
+git submodule update --depth=1 --init --recursive --jobs $(nproc) \
+  third_party/cores \
+  third_party/tests
+git submodule update --depth=1 --init --jobs $(nproc) \
+  third_party/tools/icarus \
+  third_party/tools/yosys
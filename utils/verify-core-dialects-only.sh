@@ -7,8 +7,18 @@ if [ $# -ne 1 ]; then
   exit 1
 fi
 
-# Use grep to make a list of unique ` <dialect>.` prefixes in the input.
-dialects=$( (grep -Eo '\s[a-zA-Z]+\.' "$1" || true) | sort | uniq -c)
+# Match bytes rather than locale-aware characters to keep grep fast on large
+# inputs.
+export LC_ALL=C
+
+# Use grep to find all ` <dialect>.` prefixes in the input and count the unique
+# ones with awk. This avoids sorting the full list of matches, which gets large
+# for big designs. Only the unique prefixes are sorted and then formatted like
+# the output of `uniq -c`.
+dialects=$( (grep -Eo '\s[a-zA-Z]+\.' "$1" || true) \
+  | awk '{ n[$0]++ } END { for (d in n) print d, n[d] }' \
+  | sort \
+  | awk '{ c = $NF; sub(/ [0-9]+$/, ""); printf "%7d %s\n", c, $0 }')
 
 # Complain about any non-core dialects.
 accepted="hw|comb|seq|verif|sim|dbg"
@@ -3,33 +3,69 @@
 # directory. Run this after `run.sh`.
 set -e
 cd "$(dirname "${BASH_SOURCE[0]}")/../.."
+
+# Match and sort bytes rather than locale-aware characters. This keeps grep on
+# its fast path, avoids logs with stray non-UTF-8 bytes being treated as binary,
+# and produces the same sort order on every machine.
+export LC_ALL=C
+
 mkdir -p results/sv-tests
 
+# Run grep over the NUL-separated files listed on stdin, spreading them across
+# all cores. NUL separators keep file names with spaces or quotes intact.
+# Each batch of files writes to its own temporary file, since lines longer than
+# PIPE_BUF written concurrently to a shared pipe can get spliced together. The
+# outputs are concatenated once all batches are done. Callers sort the output,
+# so its order does not matter. Nothing is run if no files are listed.
+par_grep() {
+  local dir
+  dir=$(mktemp -d)
+  xargs -0 -r -P $(nproc) -n 64 \
+    sh -c 'grep "$@" > "$(mktemp -p "$0")"' "$dir" "$@" || true
+  find "$dir" -type f -exec cat {} +
+  rm -rf "$dir"
+}
+
 # Collect the runs that segfaulted.
-grep -rl "submit a bug report" ext/sv-tests/out/logs \
+find ext/sv-tests/out/logs -type f -print0 \
+| par_grep -l "submit a bug report" \
 | sort -u > results/sv-tests/segfaults.txt
 
 # Collect the runs that had error or warning messages in tests that are not
 # expected to fail. Exclude segfaulting tests since their error output is
 # non-deterministic (depends on thread scheduling during parallel pass
 # execution), which causes flaky error counts between runs.
-grep -Erl "^[^[:space:]].* (error|warning): " ext/sv-tests/out/logs \
-| xargs grep -L "should_fail: 1" \
+find ext/sv-tests/out/logs -type f -print0 \
+| par_grep -ElZ "^[^[:space:]].* (error|warning): " \
+| par_grep -L "should_fail: 1" \
 | sort -u \
 | comm -23 - results/sv-tests/segfaults.txt \
 > results/sv-tests/diagnostics.txt
 
-# Create a ranking of the most common error messages. Legalization failures
-# include an IR dump after the op name which we strip to avoid each instance
-# counting as a unique error.
-{
-  cat results/sv-tests/diagnostics.txt \
-  | xargs grep -ho "^[^[:space:]].*error: failed to legalize operation '[^']*'" || true
-  cat results/sv-tests/diagnostics.txt \
-  | xargs grep -ho "^[^[:space:]].*error: .*" \
-  | grep -v "error: failed to legalize operation " || true
-} | sed -E 's/^.*error: /error: /' \
-  | sort | uniq -c | sort -nr > results/sv-tests/errors.txt
+# Extract every error message together with the log file that produced it, as
+# `<file>\t<error>` lines. Both the ranking and the error-to-test mapping below
+# are derived from this list, which a single grep over the logs produces.
+# Legalization failures include an IR dump after the op name which we strip to
+# avoid each instance counting as a unique error.
+errors=$(mktemp)
+trap 'rm -f "$errors"' EXIT
+tr '\n' '\0' < results/sv-tests/diagnostics.txt \
+| par_grep -H "^[^[:space:]].*error: " \
+| awk '{
+    n = index($0, ":")
+    file = substr($0, 1, n-1)
+    rest = substr($0, n+1)
+    if (index(rest, "error: failed to legalize operation ")) {
+      if (!match(rest, /^.*error: failed to legalize operation \047[^\047]*\047/))
+        next
+      rest = substr(rest, 1, RLENGTH)
+    }
+    match(rest, /.*error: /)
+    print file "\t" "error: " substr(rest, RSTART + RLENGTH)
+  }' > "$errors"
+
+# Create a ranking of the most common error messages.
+cut -f2- "$errors" | sort | uniq -c | sort -nr > results/sv-tests/errors.txt
 
 # Collect all test log file paths.
 find ext/sv-tests/out/logs -name "*.log" -type f \
@@ -38,7 +74,8 @@ find ext/sv-tests/out/logs -name "*.log" -type f \
 # Map each error to the tests that produce it.
 awk -F'\t' '
   NR == FNR {
-    src[$1] = src[$1] sprintf("    %s\n", $2)
+    msg = substr($0, length($1) + 2)
+    src[msg] = src[msg] sprintf("    %s\n", $1)
     next
   }
   {
@@ -49,19 +86,5 @@ awk -F'\t' '
     else
       print $0
   }
-' <(
-  {
-    cat results/sv-tests/diagnostics.txt \
-    | xargs grep -Ho "^[^[:space:]].*error: failed to legalize operation '[^']*'" || true
-    cat results/sv-tests/diagnostics.txt \
-    | xargs grep -Ho "^[^[:space:]].*error: .*" \
-    | grep -v "error: failed to legalize operation " || true
-  } | awk '{
-      n=index($0, ":")
-      file = substr($0, 1, n-1)
-      rest = substr($0, n+1)
-      m = index(rest, "error: ")
-      print substr(rest, m) "\t" file
-    }' \
-    | sort -u
-) results/sv-tests/errors.txt > results/sv-tests/errors-source.txt
+' <(sort -u "$errors") results/sv-tests/errors.txt \
+> results/sv-tests/errors-source.txt